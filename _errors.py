@@ -0,0 +1,9 @@
+'''
+Exceptions shared by the pure Python kernels in _kernels.py and the optional compiled
+ones in _fast.pyx, kept apart so that neither imports the other.
+'''
+
+class ConvergenceError(RuntimeError):
+    '''
+    Raised when the latitude iteration of the direct problem does not converge.
+    '''
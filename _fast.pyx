@@ -0,0 +1,131 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+'''
+Optional compiled counterparts of the kernels in _kernels.py. Build in place with
+`python build_fast.py`; without it the pure Python (or Numba) kernels
+are used instead.
+'''
+import numpy as np
+
+cimport cython
+from cython.parallel import prange
+from libc.math cimport sin, cos, sqrt, atan2, fabs, INFINITY, M_PI
+
+from _errors import ConvergenceError
+
+cdef int _iterate_lat2(double S0, double denom, double N1_sin_lat1, double a, double e2,
+                       double* lat2_out, double* N2_out) noexcept nogil:
+    # same iteration as _kernels._solve_lat2, returns 0 once converged
+    cdef double lat2, lat2_prev, lat2_prev2, s, N2, step, back_step
+    cdef int i
+
+    # initial approximate: latitude & radius of curvature in prime vertical
+    lat2 = atan2(S0, denom)
+    s = sin(lat2)
+    N2 = a / sqrt(1 - e2 * s * s)
+
+    lat2_prev = INFINITY
+    step = INFINITY
+
+    for i in range(15):
+        lat2_prev2 = lat2_prev
+        lat2_prev = lat2
+
+        lat2 = atan2(S0 + e2 * (N2 * s - N1_sin_lat1), denom)
+
+        s = sin(lat2)
+        N2 = a / sqrt(1 - e2 * s * s)
+
+        step = fabs(lat2 - lat2_prev)
+        if step < 1e-14:
+            break
+
+        # oscillation: back at the iterate before last, further from the last one
+        back_step = fabs(lat2 - lat2_prev2)
+        if back_step < 1e-15 and step > back_step:
+            lat2 = (lat2_prev + lat2) / 2
+            s = sin(lat2)
+            N2 = a / sqrt(1 - e2 * s * s)
+            step = 0.0
+            break
+
+    lat2_out[0] = lat2
+    N2_out[0] = N2
+
+    return 0 if step < 1e-10 else 1
+
+cpdef tuple solve_lat2(double S0, double denom, double N1_sin_lat1, double a, double e2):
+    '''
+    Iterates geodetic latitude (rad) and radius of curvature in prime vertical (m)
+    at point B of the direct problem. See _kernels._solve_lat2.
+    '''
+    cdef double lat2, N2
+
+    if _iterate_lat2(S0, denom, N1_sin_lat1, a, e2, &lat2, &N2):
+        raise ConvergenceError('Latitude iteration did not converge')
+
+    return lat2, N2
+
+def solve_lat2_array(const double[::1] S0, const double[::1] denom, const double[::1] N1_sin_lat1,
+                     double a, double e2):
+    '''
+    Element-wise solve_lat2 over 1-D arrays, run in parallel with OpenMP.
+
+    Returns
+    -------
+    Arrays of latitude (rad) and radius of curvature in prime vertical (m).
+    '''
+    cdef Py_ssize_t i, n = S0.shape[0]
+    cdef int failed = 0
+
+    lat2 = np.empty(n)
+    N2 = np.empty(n)
+    cdef double[::1] lat2_view = lat2
+    cdef double[::1] N2_view = N2
+
+    for i in prange(n, nogil=True):
+        failed += _iterate_lat2(S0[i], denom[i], N1_sin_lat1[i], a, e2,
+                                &lat2_view[i], &N2_view[i])
+
+    if failed:
+        raise ConvergenceError('Latitude iteration did not converge')
+
+    return lat2, N2
+
+cpdef double chord_length(double s1, double h1, double Nh1, double N1s1,
+                          double s2, double h2, double Nh2, double N2s2,
+                          double cos_fi, double mi, double e2):
+    '''
+    Computes ellipsoid chord (m). See _kernels._chord_length.
+    '''
+    # chord length
+    cdef double chord = Nh2 * Nh2 + Nh1 * Nh1 \
+        - 2 * Nh2 * Nh1 * cos_fi \
+        - mi * (N2s2 - N1s1) * (N2s2 - N1s1) \
+        - 2 * e2 * (N2s2 - N1s1) \
+        * (h2 * s2 - h1 * s1)
+
+    return sqrt(chord)
+
+# Python division semantics: meridional pairs raise ZeroDivisionError as in _kernels
+@cython.cdivision(False)
+cpdef double forward_azimuth(double s1, double c1, double s2, double c2,
+                             double sin_dlon, double cos_dlon,
+                             double Nh2, double N1s1, double N2s2, double e2):
+    '''
+    Computes azimuth (°) from point A to point B. See _kernels._forward_azimuth.
+    '''
+    # calculate 1st term
+    cdef double ctga1 = (s2 * c1 - c2 * s1 * cos_dlon) / (c2 * sin_dlon)
+
+    # calculate 2nd term
+    cdef double ctgA1 = ctga1 - e2 * ((N2s2 - N1s1) * c1) / (Nh2 * c2 * sin_dlon)
+
+    # calculate azimuth using atan2 to avoid quadrant issues
+    return atan2(1, ctgA1) * (180.0 / M_PI)
+
+cpdef tuple ecef(double s_lat, double c_lat, double s_lon, double c_lon,
+                 double h, double N, double one_minus_e2):
+    '''
+    Converts geodetic coordinates to Cartesian coordinates (m). See _kernels._ecef.
+    '''
+    return (N + h) * c_lat * c_lon, (N + h) * c_lat * s_lon, (N * one_minus_e2 + h) * s_lat
@@ -0,0 +1,114 @@
+import math
+import os
+
+from _errors import ConvergenceError
+
+# compiled Cython kernels take precedence when built (python build_fast.py)
+try:
+    import _fast
+except ImportError:
+    _fast = None
+
+# Numba is opt-in (GEODETIC_NUMBA=1) as importing it costs far more than it saves on
+# a few problems, and never imported with the compiled kernels: otherwise the kernels
+# run as plain Python functions
+njit = None
+if _fast is None and os.environ.get('GEODETIC_NUMBA') == '1':
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+
+if njit is None:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# fastmath is left off on purpose, it may change results in the last digits
+@njit(cache=True)
+def _solve_lat2(S0, denom, N1_sin_lat1, a, e2):
+    '''
+    Iterates geodetic latitude (rad) and radius of curvature in prime vertical (m)
+    at point B of the direct problem until latitude converges (at most 15 times).
+    Iterates bouncing between two values in the last digits are settled on their
+    midpoint. Raises ConvergenceError if the last step is still above 1e-10 rad.
+    '''
+    # initial approximate: latitude
+    lat2 = math.atan2(S0, denom)
+    
+    # initial approximate: radius of curvature in prime vertical
+    s = math.sin(lat2)
+    N2 = a / math.sqrt(1 - e2 * s * s)
+    
+    lat2_prev = math.inf
+    step = math.inf
+    
+    for _ in range(0, 15):
+        lat2_prev2 = lat2_prev
+        lat2_prev = lat2
+        
+        lat2 = math.atan2(S0 + e2 * (N2 * s - N1_sin_lat1), denom)
+        
+        s = math.sin(lat2)
+        N2 = a / math.sqrt(1 - e2 * s * s)
+        
+        step = abs(lat2 - lat2_prev)
+        if step < 1e-14:
+            break
+        
+        # oscillation: back at the iterate before last, further from the last one
+        back_step = abs(lat2 - lat2_prev2)
+        if back_step < 1e-15 and step > back_step:
+            lat2 = (lat2_prev + lat2) / 2
+            s = math.sin(lat2)
+            N2 = a / math.sqrt(1 - e2 * s * s)
+            step = 0.0
+            break
+    
+    if not step < 1e-10:
+        raise ConvergenceError('Latitude iteration did not converge')
+    
+    return lat2, N2
+
+def _chord_length(s1, h1, Nh1, N1s1, s2, h2, Nh2, N2s2, cos_fi, mi, e2):
+    '''
+    Computes ellipsoid chord (m) from sines of both latitudes and cosine of the central
+    angle between two points.
+    '''
+    # chord length
+    chord = Nh2**2 + Nh1**2 \
+        - 2 * Nh2 * Nh1 * cos_fi \
+        - mi * (N2s2 - N1s1)**2 \
+        - 2 * e2 * (N2s2 - N1s1) \
+        * (h2 * s2 - h1 * s1)
+    
+    return math.sqrt(chord)
+
+def _forward_azimuth(s1, c1, s2, c2, sin_dlon, cos_dlon, Nh2, N1s1, N2s2, e2):
+    '''
+    Computes azimuth (°) from point A to point B, before any normalization, from sines &
+    cosines of both latitudes and of the longitude difference. Swapping the points yields
+    the azimuth from point B to point A.
+    '''
+    # calculate 1st term
+    ctga1 = (s2 * c1 - c2 * s1 * cos_dlon) / (c2 * sin_dlon)
+    
+    # calculate 2nd term
+    ctgA1 = ctga1 - e2 * ((N2s2 - N1s1) * c1) / (Nh2 * c2 * sin_dlon)
+    
+    # calculate azimuth using atan2 to avoid quadrant issues
+    return math.degrees(math.atan2(1, ctgA1))
+
+def _ecef(s_lat, c_lat, s_lon, c_lon, h, N, one_minus_e2):
+    '''
+    Converts geodetic coordinates, given as sines & cosines of latitude and longitude
+    and height (m), to Cartesian coordinates (m).
+    '''
+    X = (N + h) * c_lat * c_lon
+    Y = (N + h) * c_lat * s_lon
+    Z = (N * one_minus_e2 + h) * s_lat
+    
+    return X, Y, Z
+
+if _fast is not None:
+    _solve_lat2, _chord_length = _fast.solve_lat2, _fast.chord_length
+    _forward_azimuth, _ecef = _fast.forward_azimuth, _fast.ecef
@@ -0,0 +1,593 @@
+import numpy as np
+
+from _kernels import ConvergenceError
+from geodetic_problems import ECEF
+
+# compiled parallel iteration, available after python build_fast.py
+try:
+    from _fast import solve_lat2_array
+except ImportError:
+    solve_lat2_array = None
+
+def _solve_lat2(S0, denom, N1_sin_lat1, a, e2):
+    '''
+    Iterates geodetic latitudes (rad) and radii of curvature in prime vertical (m)
+    at points B of the direct problem, element by element as _kernels._solve_lat2.
+    '''
+    if solve_lat2_array is not None:
+        lat2, N2 = solve_lat2_array(np.ascontiguousarray(S0).ravel(),
+                                    np.ascontiguousarray(denom).ravel(),
+                                    np.ascontiguousarray(N1_sin_lat1).ravel(), a, e2)
+        
+        # [()] turns 0-d results into scalars, as NumPy ufuncs do
+        return lat2.reshape(S0.shape)[()], N2.reshape(S0.shape)[()]
+    
+    # initial approximate: latitude
+    lat2 = np.arctan2(S0, denom)
+    
+    # initial approximate: radius of curvature in prime vertical
+    s = np.sin(lat2)
+    N2 = a / np.sqrt(1 - e2 * s * s)
+    
+    # per element state of _kernels._solve_lat2, converged elements are left as they are
+    lat2_prev = np.full_like(lat2, np.inf)
+    step = np.full_like(lat2, np.inf)
+    active = np.ones(np.shape(lat2), dtype=bool)
+    
+    for _ in range(0, 15):
+        lat2_prev2 = lat2_prev
+        lat2_prev = lat2
+        
+        lat2 = np.where(active, np.arctan2(S0 + e2 * (N2 * s - N1_sin_lat1), denom), lat2)
+        
+        step = np.where(active, np.abs(lat2 - lat2_prev), step)
+        active &= ~(step < 1e-14)
+        
+        # oscillation: back at the iterate before last, further from the last one
+        back_step = np.abs(lat2 - lat2_prev2)
+        bouncing = active & (back_step < 1e-15) & (step > back_step)
+        lat2 = np.where(bouncing, (lat2_prev + lat2) / 2, lat2)
+        step = np.where(bouncing, 0.0, step)
+        active &= ~bouncing
+        
+        s = np.sin(lat2)
+        N2 = a / np.sqrt(1 - e2 * s * s)
+        
+        if not active.any():
+            break
+    
+    if not np.all(step < 1e-10):
+        raise ConvergenceError('Latitude iteration did not converge')
+    
+    # [()] turns 0-d results into scalars, as NumPy ufuncs do
+    return lat2[()], N2[()]
+
+def _chord_length(s1, h1, N1, s2, h2, N2, cos_fi, mi, e2):
+    '''
+    Computes ellipsoid chords (m) from sines of both latitudes and cosines of the central
+    angles between point pairs, element-wise as _kernels._chord_length.
+    '''
+    # chord length
+    chord = (N2 + h2)**2 + (N1 + h1)**2 \
+        - 2 * (N2 + h2) * (N1 + h1) * cos_fi \
+        - mi * (N2 * s2 - N1 * s1)**2 \
+        - 2 * e2 * (N2 * s2 - N1 * s1) \
+        * (h2 * s2 - h1 * s1)
+    
+    return np.sqrt(chord)
+
+
+class DirectProblemBatch(object):
+    '''
+    Vectorized counterpart of DirectProblem for many points at once (requires NumPy).
+    Input values may be scalars or arrays of any shape, broadcast against each other,
+    so a batch of N problems is solved without looping in Python.
+    
+    Parameters
+    ----------
+    lat1: float or array_like
+        Geodetic latitude in decimal degrees (°) at point A in range [-90, 90].
+    
+    lon1: float or array_like
+        Geodetic longitude in decimal degrees (°) at point A, up to 360°. Converts to
+        range [-180, 180]. Examples: 285° --> -75°, -195° --> 165°
+    
+    height1: float or array_like
+        Geodetic height in meters (m) at point A.
+    
+    chord: float or array_like
+        Ellipsoidal chord in meters (m), distance from point A to point B.
+    
+    azimuth: float or array_like
+        Forward (direct) azimuth in decimal degrees (°) from point A to point B.
+    
+    zenith: float or array_like
+        Chords zenith distance in decimal degrees (°).
+    
+    a: float, optional
+        Semi-major axis (equatorial radius) of GRS80 in meters (m). Defaults to 6378137.0.
+    
+    b: float, optional
+        Semi-minor axis (polar radius) of GRS80 in meters (m). Defaults to 6356752.3141.
+    '''
+    def __init__(self, lat1, lon1, height1, chord, azimuth, zenith,
+                 a: float = 6378137.0, b: float = 6356752.3141):
+        
+        self.lat1, self.lon1, self.height1, self.chord, self.azimuth, self.zenith \
+        = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64)
+                                for x in (lat1, lon1, height1, chord, azimuth, zenith)])
+        self.a = a
+        self.b = b
+        
+        # latitude check
+        if np.any((self.lat1 < -90) | (self.lat1 > 90)):
+            raise ValueError('Latitude must be in range [-90, 90]')
+        
+        # longitude checks
+        if np.any(self.lon1 > 360):
+            raise ValueError('Longitude must not exceed 360')
+        
+        # normalize longitude to the range [-180, 180], same as math.remainder
+        self.lon1 = self.lon1 - 360 * np.round(self.lon1 / 360)
+        
+        # convert degrees to radians
+        self.lat1, self.lon1, self.azimuth, self.zenith \
+        = map(np.radians, [self.lat1, self.lon1, self.azimuth, self.zenith])
+        
+        # flattening & first eccentricity squared
+        f = 1 - self.b / self.a
+        self.e2 = f * (2 - f)
+        
+        # normal radius of curvature in prime vertical
+        self.N1 = self.a / np.sqrt(1 - self.e2 * np.sin(self.lat1)**2)
+        
+        # chord's direction cosines
+        self.l = np.cos(self.lat1) * np.cos(self.lon1) * np.cos(self.zenith) \
+        - np.sin(self.lat1) * np.cos(self.lon1) * np.sin(self.zenith) * np.cos(self.azimuth) \
+        - np.sin(self.lon1) * np.sin(self.zenith) * np.sin(self.azimuth)
+        
+        self.m = np.cos(self.lat1) * np.sin(self.lon1) * np.cos(self.zenith) \
+        - np.sin(self.lat1) * np.sin(self.lon1) * np.sin(self.zenith) * np.cos(self.azimuth) \
+        + np.cos(self.lon1) * np.sin(self.zenith) * np.sin(self.azimuth)
+        
+        self.n = np.sin(self.lat1) * np.cos(self.zenith) \
+        + np.cos(self.lat1) * np.sin(self.zenith) * np.cos(self.azimuth)
+        
+        # terms of point B's position vector independent of its latitude
+        self._Nh1 = self.N1 + self.height1
+        self._S0 = self._Nh1 * np.sin(self.lat1) + self.chord * self.n
+        self._A = self._Nh1 * np.cos(self.lat1) * np.cos(self.lon1) + self.chord * self.l
+        self._B = self._Nh1 * np.cos(self.lat1) * np.sin(self.lon1) + self.chord * self.m
+        self._denom = np.hypot(self._A, self._B)
+        self._N1sinlat1 = self.N1 * np.sin(self.lat1)
+        
+        # quantities at point B, computed lazily and only once
+        self._lat2 = None
+        self._N2 = None
+        self._lon2 = None
+        self._h2 = None
+    
+    def latitude(self):
+        '''
+        Computes geodetic latitude in decimal degrees (°) and radius of curvature in prime
+        vertical in meters (m) at point B.
+        
+        Returns
+        -------
+        Arrays of latitude in decimal degrees (°) and radius of curvature in meters (m).
+        '''
+        if self._lat2 is not None:
+            return self._lat2, self._N2
+        
+        # iterate until all latitudes converge
+        lat2, N2 = _solve_lat2(self._S0, self._denom, self._N1sinlat1, self.a, self.e2)
+        
+        self._lat2, self._N2 = np.degrees(lat2), N2
+        
+        return self._lat2, self._N2
+    
+    def longitude(self):
+        '''
+        Computes geodetic longitude in decimal degrees (°) at point B.
+        
+        Returns
+        -------
+        Array of longitudes in decimal degrees (°).
+        '''
+        if self._lon2 is not None:
+            return self._lon2
+        
+        # arctan2 already returns values in [-180, 180]
+        self._lon2 = np.degrees(np.arctan2(self._B, self._A))
+        
+        return self._lon2
+    
+    def height(self):
+        '''
+        Computes geodetic height in meters (m) at point B.
+        
+        Returns
+        -------
+        Array of heights in meters (m).
+        '''
+        if self._h2 is not None:
+            return self._h2
+        
+        # latitude & normal radius of curvature at point B
+        lat2, N2 = self.latitude()
+        
+        # sum of radius of curvature in prime vertical and height at point B
+        N2_H2 = self._denom / np.cos(np.radians(lat2))
+        
+        self._h2 = N2_H2 - N2
+        
+        return self._h2
+    
+    def reduced_distance(self):
+        '''
+        Computes reduced ellipsoid chord (heights are not taken into account).
+        
+        Returns
+        -------
+        Array of reduced ellipsoid chords in meters (m).
+        '''
+        # latitude & radius of curvature in prime vertical at point B
+        lat2, N2 = self.latitude()
+        
+        # convert degrees to radians
+        lat2 = np.radians(lat2)
+        
+        # height at point B
+        height2 = self.height()
+        
+        k = (self.height1 / self.N1) + (height2 / N2) + ((self.height1 * height2) / (self.N1 * N2))
+        
+        mi = (self.a**4 - self.b**4) / self.a**4
+        
+        tau = 2 * (N2 - self.N1) * (height2 - self.height1) \
+        + k * mi * (N2 * np.sin(lat2) - self.N1 * np.sin(self.lat1))**2 \
+        - 2 * self.e2 * (N2 * np.sin(lat2) - self.N1 * np.sin(self.lat1)) \
+        * (height2 * np.sin(lat2) - self.height1 * np.sin(self.lat1))
+        
+        p = (1 / (1 + k)) * (k + ((height2 - self.height1)**2 / self.chord**2) + (tau / self.chord**2))
+        
+        return self.chord - self.chord * (p / (1 + np.sqrt(1 - p)))
+    
+    def reverse_zenith_distance(self):
+        '''
+        Computes angular distance from the zenith above point B to point A: △ZBA.
+        
+        Returns
+        -------
+        Array of reverse zenith distances in decimal degrees (°).
+        '''
+        # latitude & radius of curvature in prime vertical at point B
+        lat2, N2 = self.latitude()
+        
+        # convert degrees to radians
+        lat2, lon2 = map(np.radians, [lat2, self.longitude()])
+        
+        # height at point B
+        height2 = self.height()
+        
+        # cosine of the central angle between two points
+        cos_fi = np.sin(self.lat1) * np.sin(lat2) \
+        + np.cos(self.lat1) * np.cos(lat2) * np.cos(lon2 - self.lon1)
+        
+        # reverse zenith distance
+        cos_zen2 = np.arccos(
+            ((self.N1 + self.height1) * cos_fi - (N2 + height2) \
+             + self.e2 * (N2 * np.sin(lat2) \
+             - self.N1 * np.sin(self.lat1)) * np.sin(lat2)) / self.chord
+        )
+        
+        return np.degrees(cos_zen2)
+    
+    def convert_to_xyz(self):
+        '''
+        Converts geodetic coordinates (ϕ, λ, h) to Cartesian coordinates (X, Y, Z).
+        
+        Returns
+        -------
+        Arrays of Cartesian coordinates in meters (m) as ECEF named tuple.
+        '''
+        # latitude & radius of curvature in prime vertical at point B
+        lat2, N2 = self.latitude()
+        
+        # convert degrees to radians
+        lat2, lon2 = map(np.radians, [lat2, self.longitude()])
+        
+        # height at point B
+        height2 = self.height()
+        
+        # get Cartesian coordinates
+        X2 = (N2 + height2) * np.cos(lat2) * np.cos(lon2)
+        Y2 = (N2 + height2) * np.cos(lat2) * np.sin(lon2)
+        Z2 = (N2 * (1 - self.e2) + height2) * np.sin(lat2)
+        
+        return ECEF(X2, Y2, Z2)
+
+
+class InverseProblemBatch(object):
+    '''
+    Vectorized counterpart of InverseProblem for many point pairs at once (requires NumPy).
+    Input values may be scalars or arrays of any shape, broadcast against each other,
+    so a batch of N problems is solved without looping in Python. Unlike InverseProblem,
+    meridional pairs (same longitude) do not raise ZeroDivisionError in the azimuth
+    methods: NumPy warns with RuntimeWarning and their azimuths come out as 0°, 180° or nan.
+    
+    Parameters
+    ----------
+    lat1: float or array_like
+        Geodetic latitude in decimal degrees (°) at point A in range [-90, 90].
+    
+    lon1: float or array_like
+        Geodetic longitude in decimal degrees (°) at point A in range [-180, 180].
+    
+    height1: float or array_like
+        Geodetic height in meters (m) at point A.
+    
+    lat2: float or array_like
+        Geodetic latitude in decimal degrees (°) at point B in range [-90, 90].
+    
+    lon2: float or array_like
+        Geodetic longitude in decimal degrees (°) at point B in range [-180, 180].
+    
+    height2: float or array_like
+        Geodetic height in meters (m) at point B.
+    
+    a: float, optional
+        Semi-major axis (equatorial radius) of GRS80 in meters (m). Defaults to 6378137.0.
+    
+    b: float, optional
+        Semi-minor axis (polar radius) of GRS80 in meters (m). Defaults to 6356752.3141.
+    '''
+    def __init__(self, lat1, lon1, height1, lat2, lon2, height2,
+                 a: float = 6378137., b: float = 6356752.3141):
+        
+        self.lat1, self.lon1, self.height1, self.lat2, self.lon2, self.height2 \
+        = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64)
+                                for x in (lat1, lon1, height1, lat2, lon2, height2)])
+        self.a = a
+        self.b = b
+        
+        # latitude checks
+        if np.any((self.lat1 < -90) | (self.lat1 > 90)) \
+        or np.any((self.lat2 < -90) | (self.lat2 > 90)):
+            raise ValueError('Latitude must be in range [-90, 90]')
+        
+        # longitude checks
+        if np.any(self.lon1 > 360) or np.any(self.lon2 > 360):
+            raise ValueError('Longitude must not exceed 360')
+        
+        # normalize longitudes to the range [-180, 180], same as math.remainder
+        self.lon1 = self.lon1 - 360 * np.round(self.lon1 / 360)
+        self.lon2 = self.lon2 - 360 * np.round(self.lon2 / 360)
+        
+        # convert degrees to radians
+        self.lat1, self.lon1, self.lat2, self.lon2 \
+        = map(np.radians, [self.lat1, self.lon1, self.lat2, self.lon2])
+        
+        # sines & cosines of both points' coordinates
+        self._s1, self._c1 = np.sin(self.lat1), np.cos(self.lat1)
+        self._sL1, self._cL1 = np.sin(self.lon1), np.cos(self.lon1)
+        self._s2, self._c2 = np.sin(self.lat2), np.cos(self.lat2)
+        self._sL2, self._cL2 = np.sin(self.lon2), np.cos(self.lon2)
+        
+        # flattening, first eccentricity squared & ellipsoid constants derived from them
+        f = 1 - self.b / self.a
+        self.e2 = f * (2 - f)
+        self._one_minus_e2 = 1 - self.e2
+        self._mi = (self.a**4 - self.b**4) / self.a**4
+        
+        # normal radius of curvature in prime vertical
+        self.N1 = self.a / np.sqrt(1 - self.e2 * self._s1 * self._s1)
+        self.N2 = self.a / np.sqrt(1 - self.e2 * self._s2 * self._s2)
+        self._N1s1 = self.N1 * self._s1
+        self._N2s2 = self.N2 * self._s2
+        
+        # sums of radius of curvature in prime vertical and height
+        self._Nh1 = self.N1 + self.height1
+        self._Nh2 = self.N2 + self.height2
+        
+        # sine & cosine of longitude difference
+        dlon = self.lon2 - self.lon1
+        self._sin_dlon, self._cos_dlon = np.sin(dlon), np.cos(dlon)
+        
+        # cosine of the central angle between two points
+        self._cos_fi = self._s1 * self._s2 + self._c1 * self._c2 * self._cos_dlon
+        
+        # ellipsoid chord, computed lazily and only once
+        self._chord = None
+    
+    def convert_to_xyz(self):
+        '''
+        Converts geodetic coordinates (ϕ, λ, h) to Cartesian coordinates (X, Y, Z).
+        
+        Returns
+        -------
+        Arrays of Cartesian coordinates in meters (m) of both points as ECEF named tuples.
+        '''
+        X1 = self._Nh1 * self._c1 * self._cL1
+        Y1 = self._Nh1 * self._c1 * self._sL1
+        Z1 = (self.N1 * self._one_minus_e2 + self.height1) * self._s1
+        
+        X2 = self._Nh2 * self._c2 * self._cL2
+        Y2 = self._Nh2 * self._c2 * self._sL2
+        Z2 = (self.N2 * self._one_minus_e2 + self.height2) * self._s2
+        
+        return ECEF(X1, Y1, Z1), ECEF(X2, Y2, Z2)
+    
+    def chord_distance(self):
+        '''
+        Computes ellipsoid chord (slant distance from A to B, not arc).
+        
+        Returns
+        -------
+        Array of ellipsoid chords in meters (m).
+        '''
+        if self._chord is not None:
+            return self._chord
+        
+        self._chord = _chord_length(self._s1, self.height1, self.N1,
+                                    self._s2, self.height2, self.N2,
+                                    self._cos_fi, self._mi, self.e2)
+        
+        return self._chord
+    
+    def cartesian_distance(self):
+        '''
+        Computes ellipsoid chord using Cartesian coordinates. Should return the same
+        values as chord_distance() method.
+        
+        Returns
+        -------
+        Array of distances (ellipsoid chords) in meters (m).
+        '''
+        xyz1, xyz2 = self.convert_to_xyz()
+        
+        # Euclidean distance
+        return np.hypot(np.hypot(xyz2.X - xyz1.X, xyz2.Y - xyz1.Y), xyz2.Z - xyz1.Z)
+    
+    def reduced_distance(self):
+        '''
+        Computes reduced ellipsoid chord (heights are not taken into account).
+        
+        Returns
+        -------
+        Array of reduced ellipsoid chords in meters (m).
+        '''
+        # sine of the central angle between two points
+        sin_2fi = np.sin((self.lat2 - self.lat1)/2)**2 \
+        + self._c1 * self._c2 * np.sin((self.lon2 - self.lon1)/2)**2
+        
+        # chord length (without heights)
+        reduced_chord = 4 * self.N1 * self.N2 * sin_2fi + (self.N2 - self.N1)**2 \
+        - self._mi * (self._N2s2 - self._N1s1)**2
+        
+        return np.sqrt(reduced_chord)
+    
+    def forward_azimuth(self):
+        '''
+        Computes foward (direct) azimuth from point A to point B.
+        
+        Returns
+        -------
+        Array of foward azimuths in decimal degrees (°), 0°, 180° or nan for meridional
+        pairs.
+        '''
+        # calculate 1st term
+        ctga1 = (self._s2 * self._c1 - self._c2 * self._s1 * self._cos_dlon) \
+        / (self._c2 * self._sin_dlon)
+        
+        # calculate 2nd term
+        ctgA1 = ctga1 - self.e2 * ((self._N2s2 - self._N1s1) * self._c1) \
+        / (self._Nh2 * self._c2 * self._sin_dlon)
+        
+        # calculate azimuth using arctan2 to avoid quadrant issues
+        azimuth = np.degrees(np.arctan2(1, ctgA1))
+        
+        # normalize the azimuth to [0, 360)
+        return azimuth % 360
+    
+    def reverse_azimuth(self):
+        '''
+        Computes reverse (backward) azimuth from point A to point B.
+        
+        Returns
+        -------
+        Array of reverse azimuths in decimal degrees (°), 0°, 180° or nan for meridional
+        pairs.
+        '''
+        # calculate 1st term
+        ctga2 = -(self._s1 * self._c2 - self._c1 * self._s2 * self._cos_dlon) \
+        / (self._c1 * self._sin_dlon)
+        
+        # calculate 2nd term
+        ctgA2 = ctga2 - self.e2 * ((self._N2s2 - self._N1s1) * self._c2) \
+        / (self._Nh1 * self._c1 * self._sin_dlon)
+        
+        # calculate azimuth using arctan2 to avoid quadrant issues
+        azimuth = np.degrees(np.arctan2(1, ctgA2))
+        
+        # reverse azimuth is typically the forward azimuth ± 180°
+        return (azimuth + 180) % 360
+    
+    def forward_zenith_distance(self):
+        '''
+        Computes angular distance from the zenith above point A to point B: △ZAB.
+        
+        Returns
+        -------
+        Array of forward zenith distances in decimal degrees (°).
+        '''
+        # forward zenith distance
+        cos_zen1 = np.arccos(
+            (self._Nh2 * self._cos_fi - self._Nh1 \
+             - self.e2 * (self._N2s2 - self._N1s1) * self._s1) / self.chord_distance()
+        )
+        
+        return np.degrees(cos_zen1)
+    
+    def reverse_zenith_distance(self):
+        '''
+        Computes angular distance from the zenith above point B to point A: △ZBA.
+        
+        Returns
+        -------
+        Array of reverse zenith distances in decimal degrees (°).
+        '''
+        # reverse zenith distance
+        cos_zen2 = np.arccos(
+            (self._Nh1 * self._cos_fi - self._Nh2 \
+             + self.e2 * (self._N2s2 - self._N1s1) * self._s2) / self.chord_distance()
+        )
+        
+        return np.degrees(cos_zen2)
+
+
+def chord_distance_vec(lat1, lon1, h1, lat2, lon2, h2,
+                       a: float = 6378137., b: float = 6356752.3141):
+    '''
+    Computes ellipsoid chords between many point pairs at once, without building
+    an InverseProblemBatch. Input values are broadcast against each other.
+    
+    Parameters
+    ----------
+    lat1, lon1, h1: float or array_like
+        Geodetic latitude (°), longitude (°) and height (m) at points A.
+    
+    lat2, lon2, h2: float or array_like
+        Geodetic latitude (°), longitude (°) and height (m) at points B.
+    
+    a: float, optional
+        Semi-major axis (equatorial radius) of GRS80 in meters (m). Defaults to 6378137.0.
+    
+    b: float, optional
+        Semi-minor axis (polar radius) of GRS80 in meters (m). Defaults to 6356752.3141.
+    
+    Returns
+    -------
+    Array of ellipsoid chords in meters (m).
+    '''
+    lat1, lon1, lat2, lon2 = [np.radians(np.asarray(x, dtype=np.float64))
+                              for x in (lat1, lon1, lat2, lon2)]
+    h1 = np.asarray(h1, dtype=np.float64)
+    h2 = np.asarray(h2, dtype=np.float64)
+    
+    # flattening, first eccentricity squared & its counterpart for the chord formula
+    f = 1 - b / a
+    e2 = f * (2 - f)
+    mi = (a**4 - b**4) / a**4
+    
+    # sines & cosines of latitudes
+    s1, c1, s2, c2 = np.sin(lat1), np.cos(lat1), np.sin(lat2), np.cos(lat2)
+    
+    # normal radius of curvature in prime vertical
+    N1 = a / np.sqrt(1 - e2 * s1 * s1)
+    N2 = a / np.sqrt(1 - e2 * s2 * s2)
+    
+    # cosine of the central angle between two points
+    cos_fi = s1 * s2 + c1 * c2 * np.cos(lon2 - lon1)
+    
+    return _chord_length(s1, h1, N1, s2, h2, N2, cos_fi, mi, e2)
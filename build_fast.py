@@ -0,0 +1,33 @@
+# Builds the optional compiled kernels in place, it does not install a package:
+# python build_fast.py (same as python build_fast.py build_ext --inplace)
+# OpenMP is used where the compiler supports it, otherwise prange loops run serially.
+import sys
+
+from setuptools import setup, Extension
+from setuptools.command.build_ext import build_ext
+from Cython.Build import cythonize
+
+class BuildExt(build_ext):
+    '''
+    Picks optimization & OpenMP flags of the compiler in use.
+    '''
+    def build_extensions(self):
+        if self.compiler.compiler_type == 'msvc':
+            compile_args, link_args = ['/O2', '/openmp'], []
+        elif sys.platform == 'darwin':
+            # Apple clang does not accept -fopenmp
+            compile_args, link_args = ['-O3'], []
+        else:
+            compile_args, link_args = ['-O3', '-fopenmp'], ['-fopenmp']
+        
+        for ext in self.extensions:
+            ext.extra_compile_args = compile_args
+            ext.extra_link_args = link_args
+        
+        super().build_extensions()
+
+# fast-math is left off on purpose, it may change results in the last digits
+extensions = [Extension('_fast', ['_fast.pyx'])]
+
+setup(ext_modules=cythonize(extensions), cmdclass={'build_ext': BuildExt},
+      script_args=sys.argv[1:] or ['build_ext', '--inplace'])
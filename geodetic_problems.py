@@ -1,4 +1,36 @@
 import math
+from typing import NamedTuple
+
+from _kernels import ConvergenceError, _solve_lat2, _chord_length, _forward_azimuth, _ecef
+
+class ECEF(NamedTuple):
+    '''
+    Cartesian coordinates (X, Y, Z) in meters (m). Replaces the former dict with keys
+    'X', 'Y' & 'Z': read coordinates as attributes, e.g. xyz.X, or call xyz._asdict()
+    where a dict is needed.
+    '''
+    X: float
+    Y: float
+    Z: float
+
+
+def _dms(decimal_degrees):
+    '''
+    Converts decimal degrees into DMS. Example: 30.5° --> 30°30'00".
+    
+    Returns
+    -------
+    Angular values expressed in DMS notation.
+    '''
+    # keep the sign apart, so that values in (-1, 0) do not lose it
+    sign = '-' if decimal_degrees < 0 else ''
+    
+    # split degrees and minutes into integer & fractional parts
+    degrees, minutes_float = divmod(abs(decimal_degrees), 1)
+    minutes, seconds = divmod(minutes_float * 60, 1)
+    
+    return f'{sign}{int(degrees)}°{int(minutes)}\'{seconds * 60:.8f}"'
+
 
 class DirectProblem(object):
     '''
@@ -12,8 +44,8 @@ class DirectProblem(object):
         Geodetic latitude in decimal degrees (°) at point A in range [-90, 90].
         
     lon1: float
-        Geodetic longitude in decimal degrees (°) at point A in range [0, 360). If negative,
-        converts to proper range. Examples: -75°E --> 285°, -195°W --> 165°
+        Geodetic longitude in decimal degrees (°) at point A, up to 360°. Converts to
+        range [-180, 180]. Examples: 285° --> -75°, -195° --> 165°
         
     height1: float
         Geodetic height in meters (m) at point A.
@@ -37,6 +69,12 @@ class DirectProblem(object):
         Whether to express angular fractions as decimal degrees or DMS.
         Defaults to True.
     '''
+    __slots__ = ('lat1', 'lon1', 'height1', 'chord', 'azimuth', 'zenith', 'a', 'b', 'dec_degs',
+                 'e2', 'N1', 'l', 'm', 'n',
+                 '_s1', '_c1', '_sL1', '_cL1', '_one_minus_e2', '_mi', '_N1s1',
+                 '_Nh1', '_S0', '_A', '_B', '_denom', '_sL2', '_cL2',
+                 '_lat2', '_N2', '_s2', '_c2', '_lon2', '_h2')
+    
     def __init__(self, lat1: float, lon1: float, height1: float,
                  chord: float, azimuth: float, zenith: float,
                  a: float = 6378137.0, b: float = 6356752.3141, dec_degs: bool = True):
@@ -57,33 +95,63 @@ class DirectProblem(object):
             
         # longitude checks
         if self.lon1 > 360:
-            raise ValueError('Longitude must be in range (-180, 180)')
+            raise ValueError('Longitude must not exceed 360')
         
-        # normalize longitude to the range (-180, 180)
-        if self.lon1 > 180:
-            self.lon1 -= 360
+        # normalize longitude to the range [-180, 180]
+        self.lon1 = math.remainder(self.lon1, 360)
             
         # convert degrees to radians
         self.lat1, self.lon1, self.azimuth, self.zenith \
         = map(math.radians, [self.lat1, self.lon1, self.azimuth, self.zenith])
         
-        # first eccentricity squared
-        self.e2 = (self.a**2 - self.b**2) / self.a**2
+        # sines & cosines of point A's coordinates
+        self._s1, self._c1 = math.sin(self.lat1), math.cos(self.lat1)
+        self._sL1, self._cL1 = math.sin(self.lon1), math.cos(self.lon1)
         
-        # normal radius of curvature in prime vertical
-        self.N1 = self.a / math.sqrt(1 - self.e2 * math.sin(self.lat1)**2)
+        # sines & cosines of the chord's angles
+        sin_az, cos_az = math.sin(self.azimuth), math.cos(self.azimuth)
+        sin_zen, cos_zen = math.sin(self.zenith), math.cos(self.zenith)
         
-        # chord's direction cosines
-        self.l = math.cos(self.lat1) * math.cos(self.lon1) * math.cos(self.zenith) \
-        - math.sin(self.lat1) * math.cos(self.lon1) * math.sin(self.zenith) * math.cos(self.azimuth) \
-        - math.sin(self.lon1) * math.sin(self.zenith) * math.sin(self.azimuth)
+        # flattening, first eccentricity squared & ellipsoid constants derived from them
+        f = 1 - self.b / self.a
+        self.e2 = f * (2 - f)
+        self._one_minus_e2 = 1 - self.e2
+        self._mi = (self.a**4 - self.b**4) / self.a**4
         
-        self.m = math.cos(self.lat1) * math.sin(self.lon1) * math.cos(self.zenith) \
-        - math.sin(self.lat1) * math.sin(self.lon1) * math.sin(self.zenith) * math.cos(self.azimuth) \
-        + math.cos(self.lon1) * math.sin(self.zenith) * math.sin(self.azimuth)
+        # normal radius of curvature in prime vertical
+        self.N1 = self.a / math.sqrt(1 - self.e2 * self._s1 * self._s1)
+        self._N1s1 = self.N1 * self._s1
         
-        self.n = math.sin(self.lat1) * math.cos(self.zenith) \
-        + math.cos(self.lat1) * math.sin(self.zenith) * math.cos(self.azimuth)
+        # chord's direction cosines
+        self.l = self._c1 * self._cL1 * cos_zen \
+        - self._s1 * self._cL1 * sin_zen * cos_az \
+        - self._sL1 * sin_zen * sin_az
+        
+        self.m = self._c1 * self._sL1 * cos_zen \
+        - self._s1 * self._sL1 * sin_zen * cos_az \
+        + self._cL1 * sin_zen * sin_az
+        
+        self.n = self._s1 * cos_zen \
+        + self._c1 * sin_zen * cos_az
+        
+        # terms of point B's position vector independent of its latitude
+        self._Nh1 = self.N1 + self.height1
+        self._S0 = self._Nh1 * self._s1 + self.chord * self.n
+        self._A = self._Nh1 * self._c1 * self._cL1 + self.chord * self.l
+        self._B = self._Nh1 * self._c1 * self._sL1 + self.chord * self.m
+        self._denom = math.hypot(self._A, self._B)
+        
+        # sine & cosine of longitude at point B
+        self._sL2 = self._B / self._denom
+        self._cL2 = self._A / self._denom
+        
+        # quantities at point B, computed lazily and only once
+        self._lat2 = None
+        self._N2 = None
+        self._s2 = None
+        self._c2 = None
+        self._lon2 = None
+        self._h2 = None
         
     def latitude(self):
         '''
@@ -92,34 +160,18 @@ class DirectProblem(object):
         
         Returns
         -------
-        Value of reduced ellipsoid chord in meters (m).
+        Value of latitude in decimal degrees (°) and radius of curvature in meters (m).
         '''
-        # initial approximate: latitude
-        numerator = (self.N1 + self.height1) * math.sin(self.lat1) + self.chord * self.n
-
-        denominator = math.sqrt(
-            ((self.N1 + self.height1) * math.cos(self.lat1) * math.cos(self.lon1) + self.chord * self.l)**2 \
-            + ((self.N1 + self.height1) * math.cos(self.lat1) * math.sin(self.lon1) + self.chord * self.m)**2
-        )
-        lat2 = math.atan(numerator / denominator)
+        if self._lat2 is not None:
+            return self._lat2, self._N2
         
-        # initial approximate: radius of curvature in prime vertical
-        N2 = self.a / math.sqrt(1 - self.e2 * math.sin(lat2)**2)
+        # iterate until latitude converges
+        lat2, N2 = _solve_lat2(self._S0, self._denom, self._N1s1, self.a, self.e2)
         
-        # repeat calculations 15 times
-        for _ in range(0, 15):
-            numerator = (self.N1 + self.height1) * math.sin(self.lat1) + self.chord * self.n \
-            + self.e2 * (N2 * math.sin(lat2) - self.N1 * math.sin(self.lat1))
-            
-            denominator = math.sqrt(
-                ((self.N1 + self.height1) * math.cos(self.lat1) * math.cos(self.lon1) + self.chord * self.l)**2 \
-                + ((self.N1 + self.height1) * math.cos(self.lat1) * math.sin(self.lon1) + self.chord * self.m)**2
-            )
-            lat2 = math.atan(numerator / denominator)
-            
-            N2 = self.a / math.sqrt(1 - self.e2 * math.sin(lat2)**2)
-            
-        return math.degrees(lat2), N2
+        self._lat2, self._N2 = math.degrees(lat2), N2
+        self._s2, self._c2 = math.sin(lat2), math.cos(lat2)
+        
+        return self._lat2, self._N2
     
     def longitude(self):
         '''
@@ -129,18 +181,13 @@ class DirectProblem(object):
         -------
         Value of longitude in decimal degrees (°).
         '''
-        X = (self.N1 + self.height1) * math.cos(self.lat1) * math.sin(self.lon1) + self.chord * self.m
-        Y = (self.N1 + self.height1) * math.cos(self.lat1) * math.cos(self.lon1) + self.chord * self.l
-        
-        lon2 = math.degrees(math.atan2(X, Y))
+        if self._lon2 is not None:
+            return self._lon2
         
-        # normalize longitude to (-180, 180)
-        if lon2 > 180:
-            lon2 -= 360
-        elif lon2 < -180:
-            lon2 += 360
+        # atan2 already returns values in range [-180, 180]
+        self._lon2 = math.degrees(math.atan2(self._B, self._A))
         
-        return lon2
+        return self._lon2
     
     def height(self):
         '''
@@ -150,17 +197,18 @@ class DirectProblem(object):
         -------
         Value of height in meters (m).
         '''
-        # convert degrees to radians 
-        lat2, lon2 = map(math.radians, [self.latitude()[0], self.longitude()])
+        if self._h2 is not None:
+            return self._h2
         
         # normal radius of curvature at point B
         N2 = self.latitude()[1]
         
         # sum of radius of curvature in prime vertical and height at point B
-        N2_H2 = ((self.N1 + self.height1) * math.cos(self.lat1) * math.sin(self.lon1) + self.chord * self.m) \
-            / ((math.cos(lat2)) * math.sin(lon2))
+        N2_H2 = self._denom / self._c2
         
-        return N2_H2 - N2
+        self._h2 = N2_H2 - N2
+        
+        return self._h2
     
     def reduced_distance(self):
         '''
@@ -170,23 +218,19 @@ class DirectProblem(object):
         -------
         Value of reduced ellipsoid chord in meters (m).
         '''
-        # convert degrees to radians 
-        lat2 = math.radians(self.latitude()[0])
-        
-        # radius of curvature in prime vertical at point B
+        # radius of curvature in prime vertical & sine of latitude at point B
         N2 = self.latitude()[1]
+        s2 = self._s2
         
         # height at point B
         height2 = self.height()
         
         k = (self.height1 / self.N1) + (height2 / N2) + ((self.height1 * height2) / (self.N1 * N2))
         
-        mi = (self.a**4 - self.b**4) / self.a**4
-        
         tau = 2 * (N2 - self.N1) * (height2 - self.height1) \
-        + k * mi * (N2 * math.sin(lat2) - self.N1 * math.sin(self.lat1))**2 \
-        - 2 * self.e2 * (N2 * math.sin(lat2) - self.N1 * math.sin(self.lat1)) \
-        * (height2 * math.sin(lat2) - self.height1 * math.sin(self.lat1))
+        + k * self._mi * (N2 * s2 - self._N1s1)**2 \
+        - 2 * self.e2 * (N2 * s2 - self._N1s1) \
+        * (height2 * s2 - self.height1 * self._s1)
         
         p = (1 / (1 + k)) * (k + ((height2 - self.height1)**2 / self.chord**2) + (tau / self.chord**2))
         
@@ -200,24 +244,23 @@ class DirectProblem(object):
         -------
         Value of reverse zenith distance in decimal degrees (°).
         '''
-        # convert degrees to radians 
-        lat2, lon2 = map(math.radians, [self.latitude()[0], self.longitude()])
-        
-        # radius of curvature in prime vertical at point B
+        # radius of curvature in prime vertical & sine of latitude at point B
         N2 = self.latitude()[1]
+        s2 = self._s2
         
         # height at point B
         height2 = self.height()
         
+        # cosine of longitude difference between two points
+        cos_dlon = self._cL2 * self._cL1 + self._sL2 * self._sL1
+        
         # cosine of the central angle between two points
-        cos_fi = math.sin(self.lat1) * math.sin(lat2) \
-        + math.cos(self.lat1) * math.cos(lat2) * math.cos(lon2 - self.lon1)
+        cos_fi = self._s1 * s2 + self._c1 * self._c2 * cos_dlon
         
         # reverse zenith distance
         cos_zen2 = math.acos(
-            ((self.N1 + self.height1) * cos_fi - (N2 + height2) \
-             + self.e2 * (N2 * math.sin(lat2) \
-             - self.N1 * math.sin(self.lat1)) * math.sin(lat2)) / self.chord
+            (self._Nh1 * cos_fi - (N2 + height2) \
+             + self.e2 * (N2 * s2 - self._N1s1) * s2) / self.chord
         )
         
         return math.degrees(cos_zen2)
@@ -228,11 +271,8 @@ class DirectProblem(object):
         
         Returns
         -------
-        Cartesian coordinates in meters (m).
+        Cartesian coordinates in meters (m) as ECEF named tuple.
         '''
-        # convert degrees to radians 
-        lat2, lon2 = map(math.radians, [self.latitude()[0], self.longitude()])
-        
         # radius of curvature in prime vertical at point B
         N2 = self.latitude()[1]
         
@@ -240,31 +280,10 @@ class DirectProblem(object):
         height2 = self.height()
         
         # get Cartesian coordinates
-        X2 = (N2 + height2) * math.cos(lat2) * math.cos(lon2)
-        Y2 = (N2 + height2) * math.cos(lat2) * math.sin(lon2)
-        Z2 = (N2 * (1 - self.e2) + height2) * math.sin(lat2)
-        
-        return {'X': X2, 'Y': Y2, 'Z': Z2}
+        return ECEF(*_ecef(self._s2, self._c2, self._sL2, self._cL2, height2, N2,
+                           self._one_minus_e2))
     
-    def decimal_to_dms(self, decimal_degrees):
-        '''
-        Converts decimal degrees into DMS. Example: 30.5° --> 30°30'00".
-        
-        Returns
-        -------
-        Angular values expressed in DMS notation.
-        '''
-        # get degrees (integer part)
-        degrees = int(decimal_degrees)
-        
-        # get the fractional part of the degrees and convert it to minutes
-        minutes_float = (abs(decimal_degrees) - abs(degrees)) * 60
-        minutes = int(minutes_float)
-        
-        # get the fractional part of the minutes and convert it to seconds
-        seconds = (minutes_float - minutes) * 60
-    
-        return f'{degrees}°{minutes}\'{seconds:.8f}"'
+    decimal_to_dms = staticmethod(_dms)
         
     def display_measures(self):
         '''
@@ -274,11 +293,14 @@ class DirectProblem(object):
         -------
         quantities: dict
         '''
+        lat2, N2 = self.latitude()
+        lon2 = self.longitude()
+        
         if self.dec_degs:
             return {
-                'Normal radius of curvature': f'{self.latitude()[1]} m',
-                'Latitude': f'{self.latitude()[0]}°',
-                'Longitude': f'{self.longitude()}°',
+                'Normal radius of curvature': f'{N2} m',
+                'Latitude': f'{lat2}°',
+                'Longitude': f'{lon2}°',
                 'Height': f'{self.height()} m',
                 'Reduced chord': f'{self.reduced_distance()} m',
                 'Reverse zenith distance': f'{self.reverse_zenith_distance()}°',
@@ -286,9 +308,9 @@ class DirectProblem(object):
             }
         else:
             return {
-                'Normal radius of curvature': f'{self.latitude()[1]} m',
-                'Latitude': self.decimal_to_dms(self.latitude()[0]),
-                'Longitude': self.decimal_to_dms(self.longitude()),
+                'Normal radius of curvature': f'{N2} m',
+                'Latitude': self.decimal_to_dms(lat2),
+                'Longitude': self.decimal_to_dms(lon2),
                 'Height': f'{self.height()} m',
                 'Reduced chord': f'{self.reduced_distance()} m',
                 'Reverse zenith distance': self.decimal_to_dms(self.reverse_zenith_distance()),
@@ -309,8 +331,9 @@ class InverseProblem(object):
         Positive for north hemisphere and negative for south hemisphere.
         
     lon1: float
-        Geodetic longitude in decimal degrees (°) at point A in range (-180, 180).
-        Negative for west hemisphere and positive for east hemisphere.
+        Geodetic longitude in decimal degrees (°) at point A in range [-180, 180].
+        Negative for west hemisphere and positive for east hemisphere. Values
+        up to 360° are converted to this range.
         
     height1: float
         Geodetic height in meters (m) at point A.
@@ -320,8 +343,9 @@ class InverseProblem(object):
         Positive for north hemisphere and negative for south hemisphere.
         
     lon2: float
-        Geodetic longitude in decimal degrees (°) at point A in range (-180, 180).
-        Negative for west hemisphere and positive for east hemisphere.
+        Geodetic longitude in decimal degrees (°) at point B in range [-180, 180].
+        Negative for west hemisphere and positive for east hemisphere. Values
+        up to 360° are converted to this range.
         
     height2: float
         Geodetic height in meters (m) at point B.
@@ -336,6 +360,12 @@ class InverseProblem(object):
         Whether to express angular fractions as decimal degrees or DMS.
         Defaults to True.
     '''
+    __slots__ = ('lat1', 'lon1', 'height1', 'lat2', 'lon2', 'height2', 'a', 'b', 'dec_degs',
+                 'e2', 'N1', 'N2',
+                 '_s1', '_c1', '_sL1', '_cL1', '_s2', '_c2', '_sL2', '_cL2',
+                 '_one_minus_e2', '_mi', '_N1s1', '_N2s2', '_Nh1', '_Nh2',
+                 '_sin_dlon', '_cos_dlon', '_cos_fi', '_chord', '_xyz1', '_xyz2')
+    
     def __init__(self, lat1: float, lon1: float, height1: float,
                  lat2: float, lon2: float, height2: float,
                  a: float = 6378137., b: float = 6356752.3141, dec_degs: bool = True):
@@ -358,42 +388,75 @@ class InverseProblem(object):
             
         # longitude checks
         if self.lon1 > 360 or self.lon2 > 360:
-            raise ValueError('Longitude must be in range [0, 360)')
+            raise ValueError('Longitude must not exceed 360')
         
-        # normalize longitudes to the range (-180, 180)
-        if self.lon1 > 180:
-            self.lon1 -= 360
-        if self.lon2 > 180:
-            self.lon2 -= 360
+        # normalize longitudes to the range [-180, 180]
+        self.lon1 = math.remainder(self.lon1, 360)
+        self.lon2 = math.remainder(self.lon2, 360)
             
         # convert degrees to radians
         self.lat1, self.lon1, self.lat2, self.lon2 \
         = map(math.radians, [self.lat1, self.lon1, self.lat2, self.lon2])
         
-        # first eccentricity squared
-        self.e2 = (self.a**2 - self.b**2) / self.a**2
+        # sines & cosines of both points' coordinates
+        self._s1, self._c1 = math.sin(self.lat1), math.cos(self.lat1)
+        self._sL1, self._cL1 = math.sin(self.lon1), math.cos(self.lon1)
+        self._s2, self._c2 = math.sin(self.lat2), math.cos(self.lat2)
+        self._sL2, self._cL2 = math.sin(self.lon2), math.cos(self.lon2)
+        
+        # flattening, first eccentricity squared & ellipsoid constants derived from them
+        f = 1 - self.b / self.a
+        self.e2 = f * (2 - f)
+        self._one_minus_e2 = 1 - self.e2
+        self._mi = (self.a**4 - self.b**4) / self.a**4
         
         # normal radius of curvature in prime vertical
-        self.N1 = self.a / math.sqrt(1 - self.e2 * math.sin(self.lat1)**2)
-        self.N2 = self.a / math.sqrt(1 - self.e2 * math.sin(self.lat2)**2)
+        self.N1 = self.a / math.sqrt(1 - self.e2 * self._s1 * self._s1)
+        self.N2 = self.a / math.sqrt(1 - self.e2 * self._s2 * self._s2)
+        self._N1s1 = self.N1 * self._s1
+        self._N2s2 = self.N2 * self._s2
         
-    def convert_to_xyz(self):
+        # sums of radius of curvature in prime vertical and height
+        self._Nh1 = self.N1 + self.height1
+        self._Nh2 = self.N2 + self.height2
+        
+        # sine & cosine of longitude difference
+        dlon = self.lon2 - self.lon1
+        self._sin_dlon, self._cos_dlon = math.sin(dlon), math.cos(dlon)
+        
+        # cosine of the central angle between two points
+        self._cos_fi = self._s1 * self._s2 + self._c1 * self._c2 * self._cos_dlon
+        
+        # ellipsoid chord & Cartesian coordinates, computed lazily and only once
+        self._chord = None
+        self._xyz1 = None
+        self._xyz2 = None
+        
+    def _cartesian(self):
         '''
-        Converts geodetic coordinates (ϕ, λ, h) to Cartesian coordinates (X, Y, Z).
+        Computes Cartesian coordinates (X, Y, Z) of both points once and reuses them.
         
         Returns
         -------
-        Cartesian coordinates in meters (m).
+        Cartesian coordinates in meters (m) as ECEF named tuples.
         '''
-        X1 = (self.N1 + self.height1) * math.cos(self.lat1) * math.cos(self.lon1)
-        Y1 = (self.N1 + self.height1) * math.cos(self.lat1) * math.sin(self.lon1)
-        Z1 = (self.N1 * (1 - self.e2) + self.height1) * math.sin(self.lat1)
+        if self._xyz1 is None:
+            self._xyz1 = ECEF(*_ecef(self._s1, self._c1, self._sL1, self._cL1, self.height1,
+                                     self.N1, self._one_minus_e2))
+            self._xyz2 = ECEF(*_ecef(self._s2, self._c2, self._sL2, self._cL2, self.height2,
+                                     self.N2, self._one_minus_e2))
         
-        X2 = (self.N2 + self.height2) * math.cos(self.lat2) * math.cos(self.lon2)
-        Y2 = (self.N2 + self.height2) * math.cos(self.lat2) * math.sin(self.lon2)
-        Z2 = (self.N2 * (1 - self.e2) + self.height2) * math.sin(self.lat2)
+        return self._xyz1, self._xyz2
+    
+    def convert_to_xyz(self):
+        '''
+        Converts geodetic coordinates (ϕ, λ, h) to Cartesian coordinates (X, Y, Z).
         
-        return {'X': X1, 'Y': Y1, 'Z': Z1}, {'X': X2, 'Y': Y2, 'Z': Z2}
+        Returns
+        -------
+        Cartesian coordinates in meters (m) of both points as ECEF named tuples.
+        '''
+        return self._cartesian()
     
     def chord_distance(self):
         '''
@@ -403,20 +466,14 @@ class InverseProblem(object):
         -------
         Value of ellipsoid chord in meters (m).
         '''
-        mi = (self.a**4 - self.b**4) / self.a**4
+        if self._chord is not None:
+            return self._chord
         
-        # cosine of the central angle between two points
-        cos_fi = math.sin(self.lat1) * math.sin(self.lat2) \
-        + math.cos(self.lat1) * math.cos(self.lat2) * math.cos(self.lon2 - self.lon1)
- 
-        # chord length
-        chord = (self.N2 + self.height2)**2 + (self.N1 + self.height1)**2 \
-            - 2 * (self.N2 + self.height2) * (self.N1 + self.height1) * cos_fi \
-            - mi * (self.N2 * math.sin(self.lat2) - self.N1 * math.sin(self.lat1))**2 \
-            - 2 * self.e2 * (self.N2 * math.sin(self.lat2) - self.N1 * math.sin(self.lat1))\
-            * (self.height2 * math.sin(self.lat2) - self.height1 * math.sin(self.lat1))
-        
-        return math.sqrt(chord)
+        self._chord = _chord_length(self._s1, self.height1, self._Nh1, self._N1s1,
+                                    self._s2, self.height2, self._Nh2, self._N2s2,
+                                    self._cos_fi, self._mi, self.e2)
+        
+        return self._chord
     
     def cartesian_distance(self):
         '''
@@ -429,18 +486,10 @@ class InverseProblem(object):
         
         '''
         # get Cartesian coordinates
-        X1 = (self.N1 + self.height1) * math.cos(self.lat1) * math.cos(self.lon1)
-        Y1 = (self.N1 + self.height1) * math.cos(self.lat1) * math.sin(self.lon1)
-        Z1 = (self.N1 * (1 - self.e2) + self.height1) * math.sin(self.lat1)
-        
-        X2 = (self.N2 + self.height2) * math.cos(self.lat2) * math.cos(self.lon2)
-        Y2 = (self.N2 + self.height2) * math.cos(self.lat2) * math.sin(self.lon2)
-        Z2 = (self.N2 * (1 - self.e2) + self.height2) * math.sin(self.lat2)
+        (X1, Y1, Z1), (X2, Y2, Z2) = self._cartesian()
         
         # Euclidean distance
-        chord = (X2 - X1)**2 + (Y2 - Y1)**2 + (Z2 - Z1)**2
-        
-        return math.sqrt(chord)
+        return math.hypot(X2 - X1, Y2 - Y1, Z2 - Z1)
     
     def reduced_distance(self):
         '''
@@ -450,15 +499,13 @@ class InverseProblem(object):
         -------
         Value of reduced ellipsoid chord in meters (m).
         '''
-        mi = (self.a**4 - self.b**4) / self.a**4
-        
         # sine of the central angle between two points
         sin_2fi = math.sin((self.lat2 - self.lat1)/2)**2 \
-        + math.cos(self.lat1) * math.cos(self.lat2) * math.sin((self.lon2 - self.lon1)/2)**2
+        + self._c1 * self._c2 * math.sin((self.lon2 - self.lon1)/2)**2
         
         # chord length (without heights)
         reduced_chord = 4 * self.N1 * self.N2 * sin_2fi + (self.N2 - self.N1)**2 \
-        - mi * (self.N2 * math.sin(self.lat2) - self.N1 * math.sin(self.lat1))**2
+        - self._mi * (self._N2s2 - self._N1s1)**2
         
         return math.sqrt(reduced_chord)
     
@@ -470,26 +517,12 @@ class InverseProblem(object):
         -------
         Value of foward azimuth in decimal degrees (°).
         '''
-        # calculate 1st term
-        ctga1 = (math.sin(self.lat2) * math.cos(self.lat1) - 
-                  math.cos(self.lat2) * math.sin(self.lat1) * 
-                  math.cos(self.lon2 - self.lon1)) / (math.cos(self.lat2) * 
-                  math.sin(self.lon2 - self.lon1))
-    
-        # calculate 2nd term
-        ctgA1 = ctga1 - self.e2 * ((self.N2 * math.sin(self.lat2) \
-                    - self.N1 * math.sin(self.lat1)) * 
-                    math.cos(self.lat1)) / ((self.N2 + self.height2) * 
-                    math.cos(self.lat2) * math.sin(self.lon2 - self.lon1))
-    
-        # calculate azimuth using atan2 to avoid quadrant issues
-        azimuth = math.degrees(math.atan2(1, ctgA1))
-    
-        # normalize the azimuth to [0, 360)
-        if azimuth > 180:
-            azimuth -= 360
+        azimuth = _forward_azimuth(self._s1, self._c1, self._s2, self._c2,
+                                   self._sin_dlon, self._cos_dlon,
+                                   self._Nh2, self._N1s1, self._N2s2, self.e2)
         
-        return azimuth
+        # normalize the azimuth to [0, 360)
+        return azimuth % 360
 
     def reverse_azimuth(self):
         '''
@@ -499,26 +532,12 @@ class InverseProblem(object):
         -------
         Value of reverse azimuth in decimal degrees (°).
         '''
-        # calculate 1st term
-        ctga2 = -(math.sin(self.lat1) * math.cos(self.lat2) - 
-                   math.cos(self.lat1) * math.sin(self.lat2) * 
-                   math.cos(self.lon2 - self.lon1)) / (math.cos(self.lat1) * 
-                   math.sin(self.lon2 - self.lon1))
-    
-        # calculate 2nd term
-        ctgA2 = ctga2 - self.e2 * ((self.N2 * math.sin(self.lat2) \
-                    - self.N1 * math.sin(self.lat1)) * 
-                    math.cos(self.lat2)) / ((self.N1 + self.height1) * 
-                    math.cos(self.lat1) * math.sin(self.lon2 - self.lon1))
-    
-        # calculate azimuth using atan2 to avoid quadrant issues
-        azimuth = math.degrees(math.atan2(1, ctgA2))
-    
-        # normalize the azimuth to [0, 360)
-        if azimuth > 180:
-            azimuth -= 360
-    
-        # reverse azimuth is typically the forward azimuth ± 180°
+        # azimuth from point B to point A
+        azimuth = _forward_azimuth(self._s2, self._c2, self._s1, self._c1,
+                                   -self._sin_dlon, self._cos_dlon,
+                                   self._Nh1, self._N2s2, self._N1s1, self.e2)
+        
+        # reverse azimuth is typically the forward azimuth ± 180°, reduced once to [0, 360)
         azimuth = (azimuth + 180) % 360
         
         return azimuth
@@ -531,15 +550,10 @@ class InverseProblem(object):
         -------
         Value of forward zenith distance in decimal degrees (°).
         '''
-        # cosine of the central angle between two points
-        cos_fi = math.sin(self.lat1) * math.sin(self.lat2) \
-        + math.cos(self.lat1) * math.cos(self.lat2) * math.cos(self.lon2 - self.lon1)
-       
         # forward zenith distance
         cos_zen1 = math.acos(
-            ((self.N2 + self.height2) * cos_fi - (self.N1 + self.height1) \
-             - self.e2 * (self.N2 * math.sin(self.lat2) \
-             - self.N1 * math.sin(self.lat1)) * math.sin(self.lat1)) / self.chord_distance()
+            (self._Nh2 * self._cos_fi - self._Nh1 \
+             - self.e2 * (self._N2s2 - self._N1s1) * self._s1) / self.chord_distance()
         )
         
         return math.degrees(cos_zen1)
@@ -552,38 +566,15 @@ class InverseProblem(object):
         -------
         Value of reverse zenith distance in decimal degrees (°).
         '''
-        # cosine of the central angle between two points
-        cos_fi = math.sin(self.lat1) * math.sin(self.lat2) \
-        + math.cos(self.lat1) * math.cos(self.lat2) * math.cos(self.lon2 - self.lon1)
-        
         # reverse zenith distance
         cos_zen2 = math.acos(
-            ((self.N1 + self.height1) * cos_fi - (self.N2 + self.height2) \
-             + self.e2 * (self.N2 * math.sin(self.lat2) \
-             - self.N1 * math.sin(self.lat1)) * math.sin(self.lat2)) / self.chord_distance()
+            (self._Nh1 * self._cos_fi - self._Nh2 \
+             + self.e2 * (self._N2s2 - self._N1s1) * self._s2) / self.chord_distance()
         )
         
         return math.degrees(cos_zen2)
     
-    def decimal_to_dms(self, decimal_degrees):
-        '''
-        Converts decimal degrees into DMS. Example: 30.5° --> 30°30'00".
-        
-        Returns
-        -------
-        Angular values expressed in DMS notation.
-        '''
-        # get degrees (integer part)
-        degrees = int(decimal_degrees)
-        
-        # get the fractional part of the degrees and convert it to minutes
-        minutes_float = (abs(decimal_degrees) - abs(degrees)) * 60
-        minutes = int(minutes_float)
-        
-        # get the fractional part of the minutes and convert it to seconds
-        seconds = (minutes_float - minutes) * 60
-    
-        return f'{degrees}°{minutes}\'{seconds:.8f}"'
+    decimal_to_dms = staticmethod(_dms)
 
     def display_measures(self):
         '''
@@ -593,10 +584,12 @@ class InverseProblem(object):
         -------
         quantities: dict
         '''
+        xyz1, xyz2 = self.convert_to_xyz()
+        
         if self.dec_degs:
             return {
-                'XYZ 1': f'{self.convert_to_xyz()[0]} m',
-                'XYZ 2': f'{self.convert_to_xyz()[1]} m',
+                'XYZ 1': f'{xyz1} m',
+                'XYZ 2': f'{xyz2} m',
                 'Chord (distance)': f'{self.chord_distance()} m',
                 'Cartesian distance': f'{self.cartesian_distance()} m',
                 'Reduced chord': f'{self.reduced_distance()} m',
@@ -607,8 +600,8 @@ class InverseProblem(object):
             }
         else:
             return {
-                'XYZ 1': f'{self.convert_to_xyz()[0]} m',
-                'XYZ 2': f'{self.convert_to_xyz()[1]} m',
+                'XYZ 1': f'{xyz1} m',
+                'XYZ 2': f'{xyz2} m',
                 'Chord (distance)': f'{self.chord_distance()} m',
                 'Cartesian distance': f'{self.cartesian_distance()} m',
                 'Reduced chord': f'{self.reduced_distance()} m',
@@ -1,8 +1,3 @@
-import matplotlib.pyplot as plt
-import matplotlib.lines as mlines
-import cartopy.crs as ccrs
-import cartopy.feature as cfeature
-
 def point_overview(lat1: float, lon1: float, lat2: float, lon2: float):
     '''
     Plots points on world map.
@@ -11,6 +6,12 @@ def point_overview(lat1: float, lon1: float, lat2: float, lon2: float):
     -------
     matplotlib figure
     '''
+    # imported here, so that the plotting stack loads only when a map is drawn
+    import matplotlib.pyplot as plt
+    import matplotlib.lines as mlines
+    import cartopy.crs as ccrs
+    import cartopy.feature as cfeature
+    
     central_lat = (lat1 + lat2)/2 + 20
     central_lon = (lon1 + lon2)/2
     